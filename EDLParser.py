@@ -1,9 +1,106 @@
 import re
 import os
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QMainWindow, QTableWidget, QTableWidgetItem, QPushButton, \
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import QMainWindow, QTableView, QPushButton, \
     QVBoxLayout, QWidget, QFileDialog, QLineEdit, QHBoxLayout
 
+# Regular expression to extract the season, episode and shot number out of a clip name
+_CLIP_RE = re.compile(
+    r'(?P<season>s\d{2})e(?P<episode>\d{2,3})'
+    r'(?:_[^_]*_[^_]*_[^_]*_[^_-]*-(?P<mov_shot>[^_.-]*).*\.mov'  # MOV clip, shot number in the fifth part
+    r'|_(?P<wav_shot>[^_-]*).*\.wav'  # WAV clip, shot number in the second part
+    r'|_.*)?'  # Any other clip, no shot number
+)
+
+
+class ClipModel(QAbstractTableModel):
+    """
+    ClipModel class for presenting the parsed clip data.
+
+    Table model to serve the clip tuples directly to the table view without creating an item for every cell.
+    """
+
+    # Header labels of the columns shown in the table view
+    HEADERS = ["Clip", "Shot", "Episode", "Season"]
+
+    def __init__(self, parent=None):
+        """
+        Initialize the ClipModel.
+
+        Parameters:
+            parent (QObject): The parent object of the model.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+
+        # List of the tuples to present on the table view
+        self._rows = []
+
+    def set_rows(self, rows):
+        """
+        Replace the data presented by the model.
+
+        Parameters:
+            rows (list): A list of (clip, shot, episode, season) tuples.
+
+        Returns:
+            None
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Return the number of rows in the model.
+
+        Returns:
+            int: The number of clips.
+        """
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Return the number of columns in the model.
+
+        Returns:
+            int: The number of header labels.
+        """
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return the value of the given cell.
+
+        Parameters:
+            index (QModelIndex): The index of the cell.
+            role (int): The role of the requested data.
+
+        Returns:
+            str: The cell value for the display role, otherwise None.
+        """
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Return the header label of the given section.
+
+        Parameters:
+            section (int): The column or row number.
+            orientation (Qt.Orientation): The orientation of the header.
+            role (int): The role of the requested data.
+
+        Returns:
+            str: The column label for the horizontal display role, otherwise the default header value.
+        """
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
 
 class EDLParserApp(QMainWindow):
     """
@@ -24,12 +121,14 @@ class EDLParserApp(QMainWindow):
         - central_widget (QWidget): The central widget of app.
         - layout (QVBoxLayout): The main layout of app.
         - horizontal_layout (QHBoxLayout): The horizontal layout for organizing items horizontally
-        - table_widget (QTableWidget): The table widget for displaying data in the tabular form.
+        - table_view (QTableView): The table view for displaying data in the tabular form.
+        - model (ClipModel): The model serving the clip data to the table view.
         - text_edit (QLineEdit): The text bar widget for address bar.
         - open_button (QPushButton): The button for opening EDL files.
         - generate_button (QPushButton): The button to generate or executing action defined in the function.
 
         clip_data (list): A list for storing data required to present on the GUI.
+        _seen_rows (set): A set of the rows already added to clip_data.
 
         Returns:
             None
@@ -40,7 +139,8 @@ class EDLParserApp(QMainWindow):
         self.central_widget = None
         self.layout = None
         self.horizontal_layout = None
-        self.table_widget = None
+        self.table_view = None
+        self.model = None
         self.text_edit = None
         self.open_button = None
         self.generate_button = None
@@ -51,6 +151,9 @@ class EDLParserApp(QMainWindow):
         # List of the data required to present on GUI
         self.clip_data = []
 
+        # Set of the rows already added to the list, to skip repeated clips
+        self._seen_rows = set()
+
     def create_ui(self):
         """
         To create the user interface for EDL Parser app.
@@ -63,6 +166,7 @@ class EDLParserApp(QMainWindow):
         # Set title and size of the window
         self.setWindowTitle("EDL Parser")
         self.setGeometry(100, 100, 800, 600)
+        width = self.width()  # Window width used to size the widgets
 
         # Setting the widget to central widget
         self.central_widget = QWidget(self)
@@ -76,11 +180,11 @@ class EDLParserApp(QMainWindow):
 
         # Create and configure the address text bar (LineEdit)
         self.text_edit = QLineEdit(self)
-        self.text_edit.setFixedWidth(int(0.7 * self.width()))
+        self.text_edit.setFixedWidth(int(0.7 * width))
 
         # Create and configure the "Open EDL File" button
         self.open_button = QPushButton('Open EDL File', self)
-        self.open_button.setFixedWidth(int(0.2 * self.width()))
+        self.open_button.setFixedWidth(int(0.2 * width))
         self.open_button.clicked.connect(self.open_file)
 
         # Adding the address bar and file opening button to Horizontal Layout
@@ -90,15 +194,15 @@ class EDLParserApp(QMainWindow):
         self.horizontal_layout.setStretch(1, 2)  # Seting stretch for button
         self.layout.addLayout(self.horizontal_layout)
 
-        # Setting the tabular view for items to load with default header and column count
-        self.table_widget = QTableWidget(self)
-        self.table_widget.setColumnCount(4)
-        self.table_widget.setHorizontalHeaderLabels(["Clip", "Shot", "Episode", "Season"])
-        self.layout.addWidget(self.table_widget)
+        # Setting the tabular view for items to load with the model providing header and column count
+        self.model = ClipModel(self)
+        self.table_view = QTableView(self)
+        self.table_view.setModel(self.model)
+        self.layout.addWidget(self.table_view)
 
         # Create and configure the "Generate Folders" button
         self.generate_button = QPushButton("Generate Folders", self)
-        self.generate_button.setFixedWidth(int(0.2 * self.width()))
+        self.generate_button.setFixedWidth(int(0.2 * width))
         self.generate_button.clicked.connect(self.generate_folders)
 
         # Setting up the Generate button position on layout.
@@ -143,6 +247,19 @@ class EDLParserApp(QMainWindow):
         except FileNotFoundError:
             raise FileNotFoundError(f"The file does not exist or is not accessible.")
 
+    def reset_clip_data(self):
+        """
+        Clear the parsed data.
+
+        Function is to empty the clip_data list and the set of added rows, so that opening a new file doesn't
+        accumulate the data of the previous one.
+
+        Returns:
+            None
+        """
+        self.clip_data = []
+        self._seen_rows = set()
+
     def parse_edl_file(self, edl_file):
         """
         Process an EDL file.
@@ -161,41 +278,42 @@ class EDLParserApp(QMainWindow):
         """
 
         try:
-            pattern = r'^s\d{2}e\d{2,3}$'  # Regular expression to filter data
-
             with open(edl_file, 'r') as file:  # Reading file with Mode 'R'
+                # Clearing the data of the previously opened file only once the new one is opened
+                self.reset_clip_data()
+
+                # Binding the methods used in the loop to local names
+                fullmatch = _CLIP_RE.fullmatch
+                seen_rows = self._seen_rows
+                append = self.clip_data.append
+
                 for line in file:  # Iterating through all lines in the loaded file
-                    if line.strip().startswith("REEL"):  # Selecting the string starting with REEL
-                        clip_name = line.split("CLIP")[1].strip()  # Splitting the string with CLIP
-                        parts = clip_name.split("_")
-
-                        # Filtering the data using patterns and then extracting required data
-                        if re.match(pattern, parts[0]):
-                            season = parts[0][0:3]
-                            episode = parts[0][3:]
+                    # Skipping lines without REEL before any stripping, then selecting the string starting with REEL
+                    if "REEL" in line and line.lstrip().startswith("REEL"):
+                        # Taking the clip name between CLIP and any following CLIP, then extracting data in one pass
+                        clip_name = line.partition("CLIP")[2].partition("CLIP")[0].strip()
+                        match = fullmatch(clip_name)
+                        if match:
+                            season = match['season']
+                            episode = f"e{match['episode'].zfill(3)}"  # Padding the episode number to 3 digits
                             shot = ''
 
-                            # Checking if the padding for episode number is less than 3
-                            if len(episode) <= 3:
-                                e_number = episode.split('e')[1]
-                                e_number = e_number.zfill(3)
-                                episode = f"e{e_number}"
-
                             # Condition if the line ending with MOV extension
-                            if parts[len(parts) - 1].endswith(".mov"):
-                                shot = parts[4].split("-")[1]
-                                shot = shot.split(".")[0]
-                                shot = shot.zfill(4)
-                                shot = f"{episode}s{shot}"
+                            if match['mov_shot'] is not None:
+                                shot = f"{episode}s{match['mov_shot'].zfill(4)}"
 
                             # Condition to check if line ending with WAV extension
-                            if parts[len(parts) - 1].endswith(".wav"):
-                                shot = parts[1].split("-")[0]
-                                shot = shot.zfill(4)
-                                shot = f"{episode}s{shot}"
+                            elif match['wav_shot'] is not None:
+                                shot = f"{episode}s{match['wav_shot'].zfill(4)}"
+
+                            # Skipping the clip if the same REEL entry is already added
+                            row = (clip_name, shot, episode, season)
+                            if row in seen_rows:
+                                continue
+                            seen_rows.add(row)
 
                             # Adding the tuple into the list
-                            self.clip_data.append((clip_name, shot, episode, season))
+                            append(row)
             self.load_edl_data()
         except IOError as e:
             raise IOError(f"An error occurred while reading the file '{edl_file}': {str(e)}")
@@ -209,14 +327,8 @@ class EDLParserApp(QMainWindow):
         Returns:
             None
         """
-        # Create number of rows based on the size of list
-        self.table_widget.setRowCount(len(self.clip_data))
-
-        # Iterate through list to set data row by row
-        for row, data in enumerate(self.clip_data):
-            # Iterate through tuple of strings to set values in column
-            for col, item in enumerate(data):
-                self.table_widget.setItem(row, col, QTableWidgetItem(item))  # setting the item value in widget
+        # Handing the list over to the model, the view fetches the cells on demand
+        self.model.set_rows(self.clip_data)
 
     def generate_folders(self):
         """
@@ -231,23 +343,22 @@ class EDLParserApp(QMainWindow):
         #  Setting the current directory as a base directory
         base_directory = os.getcwd()
 
+        # Set of shot directories already created, as different clips (e.g. the MOV and WAV of a shot) share a folder
+        created_directories = set()
+
+        # Binding the functions used in the loop to local names
+        join = os.path.join
+        makedirs = os.makedirs
+
         # Iterate through the file information list
         for file_info in self.clip_data:
             file_name, shot_folder, episode_folder, season_folder = file_info
 
-            # Create the season directory if it doesn't exist
-            season_directory = os.path.join(base_directory, season_folder)
-            if not os.path.exists(season_directory):
-                os.makedirs(season_directory)
-
-            # Create the episode directory within the season directory
-            episode_directory = os.path.join(season_directory, episode_folder)
-            if not os.path.exists(episode_directory):
-                os.makedirs(episode_directory)
-
-            # Create the shots directory within the episode directory
-            shot_directory = os.path.join(episode_directory, shot_folder)
-            if not os.path.exists(shot_directory):
-                os.makedirs(shot_directory)
+            # Create the season, episode and shot directories in one call if they don't exist
+            shot_directory = join(base_directory, season_folder, episode_folder, shot_folder)
+            if shot_directory in created_directories:
+                continue
+            makedirs(shot_directory, exist_ok=True)
+            created_directories.add(shot_directory)
 
         print("Folders created successfully.")